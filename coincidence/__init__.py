@@ -28,44 +28,85 @@ Helper functions for pytest.
 
 # stdlib
 import datetime
-
-# this package
-from coincidence.fixtures import fixed_datetime, original_datadir, path_separator, tmp_pathplus  # noqa: F401
-from coincidence.params import count, testing_boolean_values, whitespace_perms  # noqa: F401
-from coincidence.regressions import (  # noqa: F401
-		AdvancedDataRegressionFixture,
-		AdvancedFileRegressionFixture,
-		SupportsAsDict,
-		advanced_data_regression,
-		advanced_file_regression,
-		check_file_output,
-		check_file_regression
-		)
-from coincidence.selectors import (  # noqa: F401
-		max_version,
-		min_version,
-		not_docker,
-		not_macos,
-		not_pypy,
-		not_windows,
-		only_docker,
-		only_macos,
-		only_pypy,
-		only_version,
-		only_windows,
-		platform_boolean_factory
-		)
-from coincidence.utils import (  # noqa: F401
-		generate_falsy_values,
-		generate_truthy_values,
-		is_docker,
-		whitespace,
-		whitespace_perms_list,
-		with_fixed_datetime
-		)
+import importlib
+from typing import Any, List
 
 # import sys
 
+#: Mapping of lazily re-exported attribute names to the submodules they live in (:pep:`562`).
+_LAZY_IMPORTS = {
+		name: module
+		for module, names in [
+				(
+						"coincidence.fixtures",
+						(
+								"fixed_datetime",
+								"fixed_datetime_session",
+								"original_datadir",
+								"path_separator",
+								"tmp_pathplus",
+								)
+						),
+				("coincidence.params", ("count", "testing_boolean_values", "whitespace_perms")),
+				(
+						"coincidence.regressions",
+						(
+								"AdvancedDataRegressionFixture",
+								"AdvancedFileRegressionFixture",
+								"SupportsAsDict",
+								"advanced_data_regression",
+								"advanced_file_regression",
+								"check_file_output",
+								"check_file_regression",
+								)
+						),
+				(
+						"coincidence.selectors",
+						(
+								"max_version",
+								"min_version",
+								"not_docker",
+								"not_macos",
+								"not_pypy",
+								"not_windows",
+								"only_docker",
+								"only_macos",
+								"only_pypy",
+								"only_version",
+								"only_windows",
+								"platform_boolean_factory",
+								)
+						),
+				(
+						"coincidence.utils",
+						(
+								"generate_falsy_values",
+								"generate_truthy_values",
+								"is_docker",
+								"whitespace",
+								"whitespace_perms_list",
+								"with_fixed_datetime",
+								)
+						),
+				] for name in names
+		}
+
+
+def __getattr__(name: str) -> Any:  # noqa: MAN001
+	try:
+		module = _LAZY_IMPORTS[name]
+	except KeyError:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+	value = getattr(importlib.import_module(module), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> List[str]:  # noqa: MAN001
+	return [*globals(), *_LAZY_IMPORTS]
+
+
 __author__: str = "Dominic Davis-Foster"
 __copyright__: str = "2020-2021 Dominic Davis-Foster"
 __license__: str = "MIT License"
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+#
+#  _yaml_stub.py
+"""
+Placeholder for when PyYAML can't be imported.
+
+Kept out of :mod:`coincidence.regressions` so the fallback is only parsed when needed.
+"""
+#
+#  Copyright © 2023 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+#  EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+#  MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+#  IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+#  DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+#  OR OTHER DEALINGS IN THE SOFTWARE.
+#
+
+# This module is only ever imported when PyYAML is missing,
+# which never happens in the test environment.
+
+__all__ = ("DataRegressionFixture", )  # pragma: no cover
+
+
+class DataRegressionFixture:  # pragma: no cover
+	"""
+	Placeholder ``DataRegressionFixture`` for when PyYAML can't be imported.
+	"""
+
+	#: The original :exc:`ImportError`, set by :mod:`coincidence.regressions`.
+	exception: ImportError = ImportError("No module named 'yaml'")
+
+	def __init__(self, *args, **kwargs):
+		raise self.exception
@@ -39,19 +39,35 @@ See `the pytest documentation`_ for more information.
 # stdlib
 import datetime
 import os
+import sys
 from pathlib import Path
 from typing import Iterator
 
 # 3rd party
 import pytest
-from domdf_python_tools.paths import PathPlus
+from domdf_python_tools.paths import PathPlus, PosixPathPlus, WindowsPathPlus
 
 # this package
 from coincidence.utils import with_fixed_datetime
 
-__import__("pytest_datadir")
+__all__ = ("fixed_datetime", "fixed_datetime_session", "original_datadir", "tmp_pathplus", "path_separator")
 
-__all__ = ("fixed_datetime", "original_datadir", "tmp_pathplus", "path_separator")
+#: The datetime the :fixture:`~.fixed_datetime` fixtures pretend it is.
+_FIXED_DATETIME = datetime.datetime(2020, 10, 13, 2, 20)
+
+if sys.version_info < (3, 12):
+
+	_PathPlusClass = WindowsPathPlus if os.name == "nt" else PosixPathPlus
+
+	def _as_pathplus(path: Path) -> PathPlus:
+		# Copy the already-parsed parts rather than re-parsing the whole path.
+		return _PathPlusClass._from_parsed_parts(path._drv, path._root, path._parts)  # type: ignore[attr-defined]
+
+else:  # pragma: no cover
+
+	def _as_pathplus(path: Path) -> PathPlus:
+		# The pathlib internals changed in 3.12, where construction is cheap anyway.
+		return PathPlus(path)
 
 
 @pytest.fixture()
@@ -73,17 +89,26 @@ def tmp_pathplus(tmp_path: Path) -> PathPlus:
 			assert True
 	"""  # noqa: D400
 
-	return PathPlus(tmp_path)
+	return _as_pathplus(tmp_path)
 
 
 @pytest.fixture()
 def original_datadir(request) -> Path:  # noqa: D103
+	__import__("pytest_datadir")
+
 	# Work around pycharm confusing datadir with test file.
-	return PathPlus(os.path.splitext(request.module.__file__)[0] + '_')
+	filename = os.fspath(request.module.__file__)
+
+	if filename.endswith(".py"):
+		return PathPlus(filename[:-3] + '_')
+	else:  # pragma: no cover
+		# Test modules always have a .py filename in practice.
+		path = PathPlus(filename)
+		return path.with_name(path.stem + '_')
 
 
 @pytest.fixture()
-def fixed_datetime(monkeypatch) -> Iterator:
+def fixed_datetime() -> Iterator:
 	"""
 	Pytest fixture to pretend the current datetime is 2:20 AM on 13th October 2020.
 
@@ -101,20 +126,39 @@ def fixed_datetime(monkeypatch) -> Iterator:
 		Using ``from datetime import datetime`` won't work.
 	"""
 
-	with with_fixed_datetime(datetime.datetime(2020, 10, 13, 2, 20)):
+	if getattr(datetime.datetime, "_coincidence_fixed", None) == _FIXED_DATETIME:
+		# Already patched, e.g. by the fixed_datetime_session fixture.
+		yield
+	else:
+		with with_fixed_datetime(_FIXED_DATETIME):
+			yield
+
+
+@pytest.fixture(scope="session")
+def fixed_datetime_session() -> Iterator:
+	"""
+	Session-scoped version of :fixture:`~.fixed_datetime`, which patches the datetime once per session.
+
+	When this fixture is active the datetime remains fixed for the whole session,
+	and :fixture:`~.fixed_datetime` becomes a no-op rather than re-applying the patch for each test.
+
+	.. versionadded:: 0.7.0
+	"""
+
+	with with_fixed_datetime(_FIXED_DATETIME):
 		yield
 
 
 _skip_forward_mark = pytest.mark.skipif(os.sep == '\\', reason=r"Output differs on platforms where os.sep == '\\'")
 _skip_backward_mark = pytest.mark.skipif(os.sep == '/', reason="Output differs on platforms where os.sep == '/'")
 
+_path_separator_params = [
+		pytest.param('/', id="forward", marks=_skip_forward_mark),
+		pytest.param('\\', id="backward", marks=_skip_backward_mark),
+		]
+
 
-@pytest.fixture(
-		params=[
-				pytest.param('/', id="forward", marks=_skip_forward_mark),
-				pytest.param('\\', id="backward", marks=_skip_backward_mark),
-				]
-		)
+@pytest.fixture(params=_path_separator_params)
 def path_separator(request) -> str:
 	r"""
 	Parametrized pytest fixture which returns the current filesystem path separator and skips the test for the other.
@@ -31,23 +31,60 @@
 #
 
 # stdlib
-import itertools
+import math
 import random
+from functools import lru_cache
+from itertools import chain, islice, repeat
 from typing import Callable, Collection, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union, cast, overload
 
 # 3rd party
 import pytest
 from _pytest.mark import Mark, MarkDecorator, ParameterSet  # nodep
-from domdf_python_tools.iterative import extend_with_none
 
 # this package
 from coincidence.selectors import _make_version, only_version
-from coincidence.utils import generate_falsy_values, generate_truthy_values, whitespace_perms_list
+from coincidence.utils import generate_falsy_values, generate_truthy_values, whitespace
 
 __all__ = ("count", "whitespace_perms", "testing_boolean_values", "param", "parametrized_versions")
 
 _T = TypeVar("_T")
-MarkDecorator.__module__ = "_pytest.mark"
+
+if MarkDecorator.__module__ != "_pytest.mark":
+	MarkDecorator.__module__ = "_pytest.mark"
+
+#: The number of k-permutations of :data:`~.whitespace` for each length, in the order they are generated.
+_WHITESPACE_PERM_COUNTS: Tuple[Tuple[int, int], ...] = tuple((
+		n,
+		math.factorial(len(whitespace)) // math.factorial(len(whitespace) - n),
+		) for n in range(len(whitespace)))
+
+_N_WHITESPACE_PERMS: int = sum(count for _, count in _WHITESPACE_PERM_COUNTS)
+
+
+def _unrank_whitespace_perm(index: int) -> str:
+	"""
+	Returns the permutation of :data:`~.whitespace` at position ``index``.
+
+	The index is taken over the permutations of all lengths,
+	in the same order as :func:`~.whitespace_perms_list` generates them,
+	but without materialising the full list.
+	"""
+
+	for length, count in _WHITESPACE_PERM_COUNTS:
+		if index < count:
+			break
+		index -= count
+
+	pool = list(whitespace)
+	per_choice = count
+	chars = []
+
+	for _ in range(length):
+		per_choice //= len(pool)
+		choice, index = divmod(index, per_choice)
+		chars.append(pool.pop(choice))
+
+	return ''.join(chars)
 
 
 def testing_boolean_values(
@@ -69,13 +106,8 @@ def testing_boolean_values(
 	:param ratio: The ratio of the number of values to select to the total number of values.
 	"""  # noqa: D400
 
-	truthy = generate_truthy_values(extra_truthy, ratio)
-	falsy = generate_falsy_values(extra_falsy, ratio)
-
-	boolean_strings = [  # pylint: disable=use-tuple-over-list
-		*itertools.zip_longest(truthy, [], fillvalue=True),
-		*itertools.zip_longest(falsy, [], fillvalue=False),
-		]
+	boolean_strings = [(value, True) for value in generate_truthy_values(extra_truthy, ratio)]
+	boolean_strings += [(value, False) for value in generate_falsy_values(extra_falsy, ratio)]
 
 	return pytest.mark.parametrize("boolean_string, expected_boolean", boolean_strings)
 
@@ -96,8 +128,8 @@ def whitespace_perms(ratio: float = 0.5) -> MarkDecorator:
 	:param ratio: The ratio of the number of permutations to select to the total number of permutations.
 	"""  # noqa: D400
 
-	perms = whitespace_perms_list()
-	return pytest.mark.parametrize("char", random.sample(perms, int(len(perms) * ratio)))
+	indices = random.sample(range(_N_WHITESPACE_PERMS), int(_N_WHITESPACE_PERMS * ratio))
+	return pytest.mark.parametrize("char", [_unrank_whitespace_perm(index) for index in indices])
 
 
 def count(stop: int, start: int = 0, step: int = 1) -> MarkDecorator:
@@ -112,7 +144,12 @@ def count(stop: int, start: int = 0, step: int = 1) -> MarkDecorator:
 	:param step: The step passed to :class:`range`.
 	"""  # noqa: D400
 
-	return pytest.mark.parametrize("count", range(start, stop, step))
+	return pytest.mark.parametrize("count", _count_values(start, stop, step))
+
+
+@lru_cache(maxsize=128)
+def _count_values(start: int, stop: int, step: int) -> Tuple[int, ...]:
+	return tuple(range(start, stop, step))
 
 
 @overload
@@ -177,7 +214,7 @@ def param(
 	.. clearpage::
 	"""  # noqa: D400
 
-	if len([x for x in (id, idx, key) if x is not None]) > 1:
+	if (id is not None) + (idx is not None) + (key is not None) > 1:
 		raise ValueError("'id', 'idx' and 'key' are mutually exclusive.")
 
 	if idx is not None:
@@ -237,22 +274,31 @@ def parametrized_versions(
 		or a list of values which correspond to ``*versions``.
 	"""
 
-	version_list = list(versions)
-	params = []
-
 	if isinstance(reasons, str):
-		reasons = [reasons] * len(version_list)
+		reason_iter: Iterable[Optional[str]] = repeat(reasons)
 	else:
-		reasons = extend_with_none(reasons, len(version_list))
+		reason_iter = chain(reasons, repeat(None))
+
+	reasons_ = tuple(islice(reason_iter, len(versions)))
 
-	for version, reason in zip(version_list, reasons):
-		version_ = _make_version(version)
+	# Lists, Versions and other unhashable version specifiers must be normalised for the cache.
+	versions_ = tuple(
+			version if isinstance(version, (str, float)) or type(version) is tuple else tuple(version)
+			for version in versions
+			)
 
-		the_param = pytest.param(
-				f"{version_.major}.{version_.minor}",
-				marks=only_version(version_, reason=reason),
-				)
+	return list(_parametrized_versions(versions_, reasons_))
 
-		params.append(the_param)
 
-	return params
+@lru_cache()
+def _parametrized_versions(
+		versions: Tuple[Union[str, float, Tuple[int, ...]], ...],
+		reasons: Tuple[Optional[str], ...],
+		) -> Tuple[ParameterSet, ...]:
+	return tuple(
+			pytest.param(
+					f"{version_.major}.{version_.minor}",
+					marks=only_version(version_, reason=reason),
+					)
+			for version_, reason in ((_make_version(version), reason) for version, reason in zip(versions, reasons))
+			)
@@ -39,22 +39,38 @@ To enable the fixtures in this module add the following to ``conftest.py`` in yo
 
 # stdlib
 import collections
+import importlib.util
+import os
 import pathlib
 from collections import ChainMap, Counter, OrderedDict, defaultdict
 from contextlib import suppress
-from functools import partial
+from functools import lru_cache, partial
 from types import MappingProxyType
-from typing import Any, Callable, Collection, Dict, Mapping, Optional, Sequence, Type, TypeVar, Union, cast
+from typing import (
+		TYPE_CHECKING,
+		Any,
+		Callable,
+		ClassVar,
+		Collection,
+		Dict,
+		List,
+		Mapping,
+		Optional,
+		Sequence,
+		Tuple,
+		Type,
+		Union,
+		cast
+		)
 
 # 3rd party
 import pytest
 from _pytest.capture import CaptureResult  # nodep
-from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.stringlist import StringList
 from domdf_python_tools.typing import PathLike
 from pytest_regressions.common import check_text_files, perform_regression_check
 from pytest_regressions.file_regression import FileRegressionFixture
-from typing_extensions import Protocol, runtime_checkable
+from typing_extensions import Protocol
 
 __all__ = (
 		"AdvancedDataRegressionFixture",
@@ -66,74 +82,238 @@ __all__ = (
 		"check_file_output",
 		)
 
-_C = TypeVar("_C", bound=Callable)
+#: Mapping types which are coerced to a plain :class:`dict` before being checked.
+#: Concrete types come first so :func:`isinstance` short-circuits before the ``Mapping`` ABC check.
+_DICT_COERCE_TYPES = (dict, OrderedDict, Counter, defaultdict, MappingProxyType, ChainMap, Mapping)
+
+#: File extensions remapped to avoid confusing tools which glob for the real extension.
+_EXT_REMAP = {".py": "._py_"}
+
+#: Leading characters which mean a top-level YAML scalar is not plain, and so not "open-ended".
+_YAML_NON_PLAIN_STARTS = (b"'", b'"', b'!', b'&', b'*', b'|', b'>', b'{', b'[')
+
+#: The default ``check_fn`` used for regression checks.
+_DEFAULT_CHECK_FN = partial(check_text_files, encoding="UTF-8")
+
+
+class _DumpFn:
+	"""
+	A pre-bound ``dump_fn`` for :func:`~pytest_regressions.common.perform_regression_check`.
+
+	A ``__slots__``-ed class is cheaper than allocating a fresh closure per check.
+	"""
+
+	__slots__ = ("_contents", "_newline")
+
+	def __init__(self, contents: str, newline: Optional[str]):
+		self._contents = contents
+		self._newline = newline
+
+	def __call__(self, filename: PathLike) -> None:
+		# Reproduce write_clean's output (per-line trailing whitespace stripped,
+		# trailing blank lines collapsed) in a single bulk write.
+		lines = [line.rstrip() for line in self._contents.split('\n')]
+
+		while lines and not lines[-1]:
+			lines.pop()
+
+		data = '\n'.join(lines) + '\n' if lines else ''
+
+		with open(os.fspath(filename), 'w', encoding="UTF-8", newline=self._newline) as f:
+			f.write(data)
+
 
-try:
+@lru_cache(maxsize=64)
+def _resolve_extension(ext: str) -> str:
+	"""
+	Returns the reference-file extension to use for ``ext``, applying :data:`~._EXT_REMAP`.
+	"""
+
+	return _EXT_REMAP.get(ext, ext)
+
+
+if TYPE_CHECKING:
 	# 3rd party
 	from pytest_regressions.data_regression import DataRegressionFixture, RegressionYamlDumper
 
-	def _representer_for(*data_type: Type):  # noqa: MAN002
+	class AdvancedDataRegressionFixture(DataRegressionFixture):
+		"""
+		Static double of the class assembled in ``_get_advanced_data_regression_class``.
+
+		Lets annotations name the class without importing :mod:`pytest_regressions` at runtime.
+		"""
+
+		_yaml_dumper: ClassVar[Type[RegressionYamlDumper]]
+
+		def check(
+				self,
+				data_dict: Union[Sequence, "SupportsAsDict", Mapping, MappingProxyType, CaptureResult],
+				basename: Optional[str] = None,
+				fullpath: Optional[str] = None,
+				) -> None:
+			"""
+			Checks ``data_dict`` against a previously recorded version, or generates a new file.
+			"""
+
+
+def _has_asdict(obj: Any) -> bool:
+	"""
+	Returns whether ``obj`` has an ``_asdict`` method, as namedtuples do.
+
+	The class is probed rather than the instance, which avoids creating a bound method.
+	"""
+
+	return hasattr(type(obj), "_asdict")
+
+
+def _represent_mappings(dumper: "RegressionYamlDumper", data: Mapping):  # noqa: MAN002
+	if type(data) is not dict:
+		data = dict(data)
+
+	return dumper.represent_data(data)
+
+
+def _represent_sequences(dumper: "RegressionYamlDumper", data: Collection):  # noqa: MAN002
+	if type(data) is not list:
+		if type(data) is not tuple and _has_asdict(data):
+			data = dict(cast("SupportsAsDict", data)._asdict())
+		else:
+			data = list(data)
+
+	return dumper.represent_data(data)
+
+
+def _fast_lines(s: str) -> List[str]:
+	"""
+	Split ``s`` into lines, like :meth:`str.splitlines` but using the much faster :meth:`str.split`.
+
+	Falls back to :meth:`str.splitlines` when the string contains carriage returns.
+	"""
+
+	if '\r' in s:
+		return s.splitlines()
+
+	parts = s.split('\n')
+
+	if parts and parts[-1] == '':
+		parts.pop()
+
+	return parts
+
+
+def _represent_captureresult(dumper: "RegressionYamlDumper", data):  # noqa: MAN001,MAN002
+	# Build the mapping node directly, skipping the intermediate dict and its re-dispatch.
+	# The pairs are pre-sorted to match represent_mapping's sorting of dict items.
+	return dumper.represent_mapping(
+			"tag:yaml.org,2002:map",
+			[("err", _fast_lines(data.err)), ("out", _fast_lines(data.out))],
+			)
+
+
+def _represent_pathlib(dumper: "RegressionYamlDumper", data: pathlib.PurePath):  # noqa: MAN002
+	return dumper.represent_str(data.as_posix())
+
+
+def _represent_bytes(dumper: "RegressionYamlDumper", data: Union[bytes, bytearray]):  # noqa: MAN002
+	# Without this, bytes-like sequences would fall through to the sequence
+	# representer and be dumped as lists of integers.
+	if type(data) is not bytes:
+		data = bytes(data)
+
+	return dumper.represent_binary(data)
+
+
+def _register_representers(dumper: Type["RegressionYamlDumper"]) -> None:
+	"""
+	Register the custom YAML representers on ``dumper``.
+
+	The multi-representer table is written directly
+	(these are multi-representers so dispatch stays polymorphic),
+	skipping the per-call indirection of ``add_custom_yaml_representer``.
+	"""
+
+	if "yaml_representers" not in dumper.__dict__:
+		dumper.yaml_representers = dumper.yaml_representers.copy()
 
-		def deco(representer_fn: _C) -> _C:
-			for dtype in data_type:
-				RegressionYamlDumper.add_custom_yaml_representer(dtype, representer_fn)
+	if "yaml_multi_representers" not in dumper.__dict__:
+		dumper.yaml_multi_representers = dumper.yaml_multi_representers.copy()
 
-			return representer_fn
+	# Exact-type entries for the common containers, so plain dicts, lists and tuples
+	# go straight to the stock representers with no coercion copy.
+	representers = dumper.yaml_representers
+	representers[dict] = dumper.represent_dict
+	representers[list] = dumper.represent_list
+	representers[tuple] = dumper.represent_list
 
-		return deco
+	multi_representers = dumper.yaml_multi_representers
 
-	@_representer_for(
+	mapping_types = (
 			collections.abc.Mapping,
 			collections.OrderedDict,
 			collections.Counter,
 			collections.defaultdict,
 			MappingProxyType,
 			)
-	def _represent_mappings(dumper: RegressionYamlDumper, data: Mapping):  # noqa: MAN002
-		data = dict(data)
-		return dumper.represent_data(data)
 
-	@_representer_for(collections.abc.Sequence, tuple)
-	def _represent_sequences(dumper: RegressionYamlDumper, data: Collection):  # noqa: MAN002
-		if isinstance(data, SupportsAsDict):
-			data = dict(data._asdict())
-		else:
-			data = list(data)
+	for dtype in mapping_types:
+		multi_representers[dtype] = _represent_mappings
+
+	multi_representers[collections.abc.Sequence] = _represent_sequences
+	multi_representers[tuple] = _represent_sequences
+
+	multi_representers[bytes] = _represent_bytes
+	multi_representers[bytearray] = _represent_bytes
+
+	multi_representers[CaptureResult] = _represent_captureresult
 
-		return dumper.represent_data(data)
+	# The representer is polymorphic, so PurePath covers Path, PathPlus and friends.
+	multi_representers[pathlib.PurePath] = _represent_pathlib
+
+	getattr(dumper, "_representer_cache", {}).clear()
+
+
+_toml_registered = False
+
+
+def _register_toml_representer(dumper: Type["RegressionYamlDumper"]) -> None:
+	"""
+	Register the representer for toml's ``InlineTableDict``, if :mod:`toml` is installed.
+
+	The registration happens at first fixture use rather than at import,
+	and checks for the module's availability rather than whether it has
+	been imported yet, so it doesn't depend on test ordering.
+	"""
 
-	@_representer_for(CaptureResult)
-	def _represent_captureresult(dumper: RegressionYamlDumper, data):  # noqa: MAN001,MAN002
-		data = dict(out=data.out.splitlines(), err=data.err.splitlines())
-		return dumper.represent_data(data)
+	global _toml_registered
+
+	if _toml_registered:
+		return
+
+	if not hasattr(dumper, "yaml_multi_representers"):  # pragma: no cover
+		return  # PyYAML itself is unavailable
+
+	if importlib.util.find_spec("toml") is None:  # pragma: no cover
+		# Not installed, so no InlineTableDict can ever turn up in regression data.
+		# (toml is always installed for this package's own test suite.)
+		_toml_registered = True
+		return
 
 	with suppress(ImportError):
 		# 3rd party
 		import toml
+		from pytest_regressions.data_regression import RegressionYamlDumper
 
-		_representer_for(toml.decoder.InlineTableDict)(_represent_mappings)
-
-	@_representer_for(
-			pathlib.PurePath,
-			pathlib.PurePosixPath,
-			pathlib.PureWindowsPath,
-			pathlib.Path,
-			PathPlus,
-			)
-	def _represent_pathlib(dumper: RegressionYamlDumper, data: pathlib.PurePath):  # noqa: MAN002
-		return dumper.represent_str(data.as_posix())
-
-except ImportError as e:  # pragma: no cover
-	if not str(e).endswith("'yaml'"):
-		raise
+		dumper.yaml_multi_representers[toml.decoder.InlineTableDict] = _represent_mappings
+		getattr(dumper, "_representer_cache", {}).clear()
 
-	class DataRegressionFixture:  # type: ignore[no-redef]
-		"""
-		Placeholder ``DataRegressionFixture`` for when PyYAML can't be imported.
-		"""
+		if dumper is not RegressionYamlDumper:
+			# Keep pytest_regressions' own data_regression fixture working with inline tables too.
+			RegressionYamlDumper.add_custom_yaml_representer(
+					toml.decoder.InlineTableDict,
+					_represent_mappings,  # type: ignore[arg-type]
+					)
 
-		def __init__(self, *args, **kwargs):
-			raise e
+	_toml_registered = True
 
 
 def check_file_regression(
@@ -156,7 +336,7 @@ def check_file_regression(
 
 	__tracebackhide__ = True
 
-	if isinstance(data, StringList):
+	if type(data) is not str and isinstance(data, StringList):
 		data = str(data)
 
 	file_regression.check(data, encoding="UTF-8", extension=extension, **kwargs)
@@ -185,20 +365,20 @@ def check_file_output(
 	.. seealso:: :meth:`.AdvancedFileRegressionFixture.check_file`
 	"""
 
-	filename = PathPlus(filename)
+	# A raw open avoids the PathPlus construction; decode explicitly,
+	# as FileRegressionFixture.check re-encodes anyway.
+	fname = os.fspath(filename)
 
-	data = filename.read_text(encoding="UTF-8")
-	extension = extension or filename.suffix
+	with open(fname, "rb") as f:
+		data = f.read().decode("utf-8")
 
-	if extension == ".py":
-		extension = "._py_"
+	extension = _resolve_extension(extension or os.path.splitext(fname)[1])
 
 	__tracebackhide__ = True
 
 	return check_file_regression(data, file_regression, extension, newline=newline, **kwargs)
 
 
-@runtime_checkable
 class SupportsAsDict(Protocol):
 	"""
 	:class:`typing.Protocol` for classes like :func:`collections.namedtuple` and :class:`typing.NamedTuple`
@@ -211,71 +391,237 @@ class SupportsAsDict(Protocol):
 		"""
 
 
-class AdvancedDataRegressionFixture(DataRegressionFixture):
-	"""
-	Subclass of :class:`~pytest_regressions.data_regression.DataRegressionFixture` with support for additional types.
+_advanced_data_regression_class: Optional[Type["AdvancedDataRegressionFixture"]] = None
 
-	The following types and their subclasses are supported:
 
-	* :class:`collections.abc.Mapping`, :class:`typing.Mapping` (including :class:`dict` and :class:`typing.Dict`)
-	* :class:`collections.abc.Sequence`, :class:`typing.Sequence` (including :class:`list`, :py:obj:`typing.Tuple` etc.)
-	* :class:`collections.OrderedDict`, :class:`typing.OrderedDict`
-	* :class:`collections.Counter`, :class:`typing.Counter`
-	* :class:`types.MappingProxyType` (cannot be subclassed)
-	* :class:`_pytest.capture.CaptureResult` (the type of :meth:`capsys.readouterr() <pytest.CaptureFixture.readouterr>`)
-	* Any type which implements the :protocol:`SupportsAsDict` protocol (including :func:`collections.namedtuple` and :class:`typing.NamedTuple`)
+def _get_advanced_data_regression_class() -> Type["AdvancedDataRegressionFixture"]:
+	"""
+	Build :class:`~.AdvancedDataRegressionFixture` on first use.
 
-	.. clearpage::
-	.. autoclasssumm:: AdvancedDataRegressionFixture
-		:autosummary-sections: ;;
+	Deferring the construction keeps PyYAML and :mod:`pytest_regressions.data_regression`
+	out of the import graph for test suites which never use the fixture.
 	"""
 
-	def check(
-			self,
-			data_dict: Union[Sequence, SupportsAsDict, Mapping, MappingProxyType, CaptureResult],
-			basename: Optional[str] = None,
-			fullpath: Optional[str] = None,
-			) -> None:
-		"""
-		Checks ``data`` against a previously recorded version, or generates a new file.
+	global _advanced_data_regression_class
+
+	if _advanced_data_regression_class is not None:
+		return _advanced_data_regression_class
 
-		:param data_dict:
+	try:
+		# 3rd party
+		from pytest_regressions.data_regression import DataRegressionFixture, RegressionYamlDumper
+	except ImportError as e:  # pragma: no cover
+		if not str(e).endswith("'yaml'"):
+			raise
+
+		# this package
+		from coincidence._yaml_stub import DataRegressionFixture  # type: ignore[misc]
+
+		DataRegressionFixture.exception = e  # type: ignore[attr-defined]
+		yaml_dumper: type = DataRegressionFixture  # placeholder; never used for dumping
+
+	else:
+		# 3rd party
+		import yaml
+
+		_register_representers(RegressionYamlDumper)
+
+		if getattr(yaml, "__with_libyaml__", False):
+			_dumper_base: type = yaml.CSafeDumper
+		else:  # pragma: no cover
+			_dumper_base = RegressionYamlDumper
+
+		class _FastRegressionYamlDumper(_dumper_base):  # type: ignore[misc,valid-type]
+			"""
+			Variant of :class:`~pytest_regressions.data_regression.RegressionYamlDumper`
+			built on libyaml's :class:`yaml.CSafeDumper` where available,
+			with representer dispatch memoised per type.
+
+			Representers registered on ``RegressionYamlDumper`` via its documented
+			``add_custom_yaml_representer`` API are honoured as a fallback.
+
+			.. caution::
+
+				libyaml's emitter formats a few corner cases differently from the
+				pure-Python one -- e.g. empty-string mapping keys (``'': 2`` rather
+				than ``? ''``) and C1 control characters such as NEL -- so reference
+				files recorded with the other emitter for such data may need
+				regenerating with ``--force-regen``.
+				(The differing ``...`` document terminator is compensated for in
+				:meth:`AdvancedDataRegressionFixture.check`.)
+			"""  # noqa: D400
+
+			#: Memoised ``type -> representer`` resolution, shared by all instances.
+			_representer_cache: Dict[type, Callable] = {}
+
+			@classmethod
+			def add_custom_yaml_representer(cls, data_type: type, representer_fn: Callable) -> None:
+				# Use multi-representer for polymorphism, matching RegressionYamlDumper.
+				cls._representer_cache.clear()
+				cls.add_multi_representer(data_type, representer_fn)
+
+			def represent_data(self, data: Any):  # noqa: MAN002
+				# Aliases are always ignored, so the usual alias bookkeeping is skipped.
+				self.alias_key = None
+
+				data_type = type(data)
+				representer = self._representer_cache.get(data_type)
+
+				if representer is None:
+					representer = self._resolve_representer(data_type)
 
-		:param basename: The basename of the file to test/record.
-			If not given the name of the test is used.
+					if representer is None:
+						# Unknown type.  Left uncached so representers registered
+						# later via RegressionYamlDumper are still picked up.
+						return self.represent_undefined(data)
 
-		:param fullpath: The complete path to use as a reference file.
-			This option will ignore ``datadir`` fixture when reading *expected* files,
-			but will still use it to write *obtained* files.
-			Useful if a reference file is located in the session data dir, for example.
+					self._representer_cache[data_type] = representer
 
-		.. note::  ``basename`` and ``fullpath`` are exclusive.
+				return representer(self, data)
+
+			@classmethod
+			def _resolve_representer(cls, data_type: type) -> Optional[Callable]:
+				# Mirrors the MRO walk in BaseRepresenter.represent_data,
+				# then falls back to RegressionYamlDumper's tables so representers
+				# registered via its documented add_custom_yaml_representer API
+				# work even though this class may not inherit from it.
+				table_owners: Tuple[Type[Any], ...] = (cls, RegressionYamlDumper)
+
+				for table_owner in table_owners:
+					if data_type in table_owner.yaml_representers:
+						return table_owner.yaml_representers[data_type]
+
+					for base in data_type.__mro__:
+						if base in table_owner.yaml_multi_representers:
+							return table_owner.yaml_multi_representers[base]
+
+				return None
+
+		_register_representers(_FastRegressionYamlDumper)
+		yaml_dumper = _FastRegressionYamlDumper
+
+	class AdvancedDataRegressionFixture(DataRegressionFixture):
 		"""
+		Subclass of :class:`~pytest_regressions.data_regression.DataRegressionFixture` with support for additional types.
+
+		The following types and their subclasses are supported:
+
+		* :class:`collections.abc.Mapping`, :class:`typing.Mapping` (including :class:`dict` and :class:`typing.Dict`)
+		* :class:`collections.abc.Sequence`, :class:`typing.Sequence` (including :class:`list`, :py:obj:`typing.Tuple` etc.)
+		* :class:`collections.OrderedDict`, :class:`typing.OrderedDict`
+		* :class:`collections.Counter`, :class:`typing.Counter`
+		* :class:`types.MappingProxyType` (cannot be subclassed)
+		* :class:`_pytest.capture.CaptureResult` (the type of :meth:`capsys.readouterr() <pytest.CaptureFixture.readouterr>`)
+		* Any type which implements the :protocol:`SupportsAsDict` protocol (including :func:`collections.namedtuple` and :class:`typing.NamedTuple`)
 
-		if isinstance(data_dict, (Mapping, OrderedDict, Counter, defaultdict, MappingProxyType, ChainMap)):
-			data_dict = dict(data_dict)
-		elif isinstance(data_dict, CaptureResult) and isinstance(data_dict.out, str):
-			data_dict = dict(
-					out=data_dict.out.splitlines(),
-					err=data_dict.err.splitlines(),  # type: ignore[attr-defined]
+		.. clearpage::
+		.. autoclasssumm:: AdvancedDataRegressionFixture
+			:autosummary-sections: ;;
+		"""
+
+		_yaml_dumper = yaml_dumper
+
+		def check(
+				self,
+				data_dict: Union[Sequence, SupportsAsDict, Mapping, MappingProxyType, CaptureResult],
+				basename: Optional[str] = None,
+				fullpath: Optional[str] = None,
+				) -> None:
+			"""
+			Checks ``data`` against a previously recorded version, or generates a new file.
+
+			:param data_dict:
+
+			:param basename: The basename of the file to test/record.
+				If not given the name of the test is used.
+
+			:param fullpath: The complete path to use as a reference file.
+				This option will ignore ``datadir`` fixture when reading *expected* files,
+				but will still use it to write *obtained* files.
+				Useful if a reference file is located in the session data dir, for example.
+
+			.. note::  ``basename`` and ``fullpath`` are exclusive.
+			"""
+
+			__tracebackhide__ = True
+
+			# Exact dict/list/tuple instances are the common case and need no coercion.
+			dtype = type(data_dict)
+			if dtype is not dict and dtype is not list and dtype is not tuple:
+				if isinstance(data_dict, _DICT_COERCE_TYPES):
+					data_dict = dict(data_dict)
+				elif isinstance(data_dict, CaptureResult) and isinstance(data_dict.out, str):
+					data_dict = dict(
+							out=_fast_lines(data_dict.out),
+							err=_fast_lines(data_dict.err),  # type: ignore[arg-type]
+							)
+				elif _has_asdict(data_dict):
+					# _asdict() already returns a fresh dict (Python 3.8+)
+					data_dict = cast(SupportsAsDict, data_dict)._asdict()
+				elif isinstance(data_dict, Sequence):
+					data_dict = list(data_dict)
+
+			def dump(filename: pathlib.Path) -> None:
+				dumped_str = yaml.dump_all(
+						[data_dict],
+						Dumper=yaml_dumper,
+						default_flow_style=False,
+						allow_unicode=True,
+						indent=2,
+						encoding="utf-8",
+						)
+
+				if (
+						not isinstance(data_dict, (dict, list, tuple))
+						and not dumped_str.startswith(_YAML_NON_PLAIN_STARTS)
+						and not dumped_str.endswith(b"...\n")
+						):
+					# The pure-Python emitter terminates open-ended documents
+					# (plain top-level scalars) with '...'; libyaml does not.
+					dumped_str += b"...\n"
+
+				with filename.open("wb") as f:
+					f.write(dumped_str)
+
+			perform_regression_check(
+					datadir=self.datadir,
+					original_datadir=self.original_datadir,
+					request=self.request,
+					check_fn=_DEFAULT_CHECK_FN,
+					dump_fn=dump,
+					extension=".yml",
+					basename=basename,
+					fullpath=fullpath,
+					force_regen=self.force_regen,
+					with_test_class_names=self.with_test_class_names,
 					)
-		elif isinstance(data_dict, SupportsAsDict):
-			data_dict = dict(data_dict._asdict())
-		elif isinstance(data_dict, Sequence):
-			data_dict = list(data_dict)
 
-		__tracebackhide__ = True
+	AdvancedDataRegressionFixture.__module__ = __name__
+	AdvancedDataRegressionFixture.__qualname__ = AdvancedDataRegressionFixture.__name__
+
+	# The class built here is the runtime counterpart of the static double declared under TYPE_CHECKING.
+	_advanced_data_regression_class = cast(Any, AdvancedDataRegressionFixture)
+	return _advanced_data_regression_class
 
-		super().check(data_dict, basename=basename, fullpath=fullpath)
+
+def __getattr__(name: str) -> Any:  # noqa: MAN001
+	if name == "AdvancedDataRegressionFixture":
+		return _get_advanced_data_regression_class()
+	elif name == "DataRegressionFixture":
+		return _get_advanced_data_regression_class().__bases__[0]
+
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @pytest.fixture()
-def advanced_data_regression(datadir, original_datadir, request) -> AdvancedDataRegressionFixture:  # noqa: MAN001
+def advanced_data_regression(datadir, original_datadir, request) -> "AdvancedDataRegressionFixture":  # noqa: MAN001
 	"""
 	Pytest fixture for performing regression tests on lists, dictionaries and namedtuples.
 	"""
 
-	return AdvancedDataRegressionFixture(datadir, original_datadir, request)
+	fixture_class = _get_advanced_data_regression_class()
+	_register_toml_representer(fixture_class._yaml_dumper)
+	return fixture_class(datadir, original_datadir, request)
 
 
 class AdvancedFileRegressionFixture(FileRegressionFixture):
@@ -318,21 +664,19 @@ class AdvancedFileRegressionFixture(FileRegressionFixture):
 			raise TypeError(f"Expected text contents but received type {type(contents).__name__!r}")
 
 		if check_fn is None:
-			check_fn = partial(check_text_files, encoding="UTF-8")
-
-		def dump_fn(filename: PathLike) -> None:
-			PathPlus(filename).write_clean(cast(str, contents))
+			check_fn = _DEFAULT_CHECK_FN
 
 		perform_regression_check(
 				datadir=self.datadir,
 				original_datadir=self.original_datadir,
 				request=self.request,
 				check_fn=check_fn,
-				dump_fn=dump_fn,
+				dump_fn=_DumpFn(contents, newline),
 				extension=extension,
 				basename=basename,
 				fullpath=fullpath,
 				force_regen=self.force_regen,
+				with_test_class_names=self.with_test_class_names,
 				obtained_filename=obtained_filename,
 				)
 
@@ -368,13 +712,12 @@ class AdvancedFileRegressionFixture(FileRegressionFixture):
 		.. seealso:: :func:`~.check_file_output`
 		"""
 
-		filename = PathPlus(filename)
+		fname = os.fspath(filename)
 
-		data = filename.read_text(encoding="UTF-8")
-		extension = extension or filename.suffix
+		with open(fname, "rb") as f:
+			data = f.read().decode("utf-8")
 
-		if extension == ".py":
-			extension = "._py_"
+		extension = _resolve_extension(extension or os.path.splitext(fname)[1])
 
 		__tracebackhide__ = True
 
@@ -27,10 +27,9 @@ Pytest decorators for selectively running tests.
 #
 
 # stdlib
-import inspect
 import sys
-from textwrap import dedent
-from typing import Callable, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
 
 # 3rd party
 import pytest
@@ -59,13 +58,52 @@ __all__ = (
 		)
 
 
+#: The version of the current Python interpreter, as a plain tuple for C-level comparisons.
+_CURRENT_VERSION: Tuple[int, int, int] = sys.version_info[:3]
+
+_IS_WINDOWS = sys.platform == "win32"
+_IS_MACOS = sys.platform == "darwin"
+_IS_LINUX = sys.platform == "linux"
+
+#: Pre-dedented docstring template for the functions made by :func:`~.platform_boolean_factory`.
+_PLATFORM_DOCSTRING_TEMPLATE = """\
+Factory function to return a ``@pytest.mark.skipif`` decorator which will
+skip a test {why} {platform_phrase}.
+
+{versionadded_string}
+:param reason: The reason to display when skipping.
+"""
+
+
+_VERSION_CTORS: Dict[type, Callable[[Any], Version]] = {
+		float: Version.from_float,
+		str: Version.from_str,
+		tuple: Version.from_tuple,
+		}
+
+
+@lru_cache(maxsize=None)
+def _parse_version(version: Union[str, float, Tuple[int, ...]]) -> Version:
+	return _VERSION_CTORS.get(type(version), Version.from_tuple)(version)
+
+
 def _make_version(version: Union[str, float, Tuple[int, ...]]) -> Version:
-	if isinstance(version, float):
-		return Version.from_float(version)
-	elif isinstance(version, str):
-		return Version.from_str(version)
-	else:
-		return Version.from_tuple(version)
+	if isinstance(version, Version):
+		# Version is unhashable, so can't go through the cache -- and needs no parsing anyway.
+		return version
+
+	if not isinstance(version, (str, float, tuple)):
+		# Lists and other iterables are unhashable; normalise them for the cache.
+		version = tuple(version)
+
+	return _parse_version(version)
+
+
+@lru_cache(maxsize=None)
+def _skipif_mark(condition: bool, reason: str) -> MarkDecorator:
+	# MarkDecorators are immutable, so repeat calls with the same
+	# condition and reason (common in parametrize tables) share one object.
+	return pytest.mark.skipif(condition=condition, reason=reason)
 
 
 def min_version(
@@ -86,7 +124,7 @@ def min_version(
 	if reason is None:  # pragma: no cover
 		reason = f"Requires Python {version_} or greater."
 
-	return pytest.mark.skipif(condition=sys.version_info[:3] < version_, reason=reason)
+	return _skipif_mark(_CURRENT_VERSION < tuple(version_), reason)
 
 
 def max_version(
@@ -107,7 +145,7 @@ def max_version(
 	if reason is None:  # pragma: no cover
 		reason = f"Not needed after Python {version_}."
 
-	return pytest.mark.skipif(condition=sys.version_info[:3] > version_, reason=reason)
+	return _skipif_mark(_CURRENT_VERSION > tuple(version_), reason)
 
 
 def only_version(
@@ -128,7 +166,7 @@ def only_version(
 	if reason is None:  # pragma: no cover
 		reason = f"Not needed on Python {version_}."
 
-	return pytest.mark.skipif(condition=sys.version_info[:2] != version_[:2], reason=reason)
+	return _skipif_mark(_CURRENT_VERSION[:2] != version_[:2], reason)
 
 
 def platform_boolean_factory(
@@ -137,6 +175,7 @@ def platform_boolean_factory(
 		versionadded: Optional[str] = None,
 		*,
 		module: Optional[str] = None,
+		platform_phrase: Optional[str] = None,
 		) -> Tuple[Callable[..., MarkDecorator], Callable[..., MarkDecorator]]:
 	"""
 	Factory function to return decorators such as :func:`~.not_pypy` and :func:`~.only_windows`.
@@ -146,6 +185,8 @@ def platform_boolean_factory(
 	:param versionadded:
 	:param module: The module to set the function as belonging to in ``__module__``.
 		If :py:obj:`None` ``__module__`` is set to ``'coincidence.selectors'``.
+	:param platform_phrase: The phrase describing the platform in the generated docstrings.
+	:default platform_phrase: :file:`'the current platform is {<platform>}'`
 
 	:return: 2-element tuple of ``not_function``, ``only_function``.
 	"""
@@ -153,68 +194,80 @@ def platform_boolean_factory(
 	default_reason = f"{{}} required on {platform}"
 	module = module or platform_boolean_factory.__module__
 
-	def not_function(reason: str = default_reason.format("Not")) -> MarkDecorator:
-		return pytest.mark.skipif(condition=condition, reason=reason)
+	# The conditions are bound as defaults so the calls read locals rather than closure cells.
 
-	def only_function(reason: str = default_reason.format("Only")) -> MarkDecorator:
-		return pytest.mark.skipif(condition=not condition, reason=reason)
-
-	docstring = dedent(
-			"""\
-Factory function to return a ``@pytest.mark.skipif`` decorator which will
-skip a test {why} the current platform is {platform}.
-
-{versionadded_string}
-:param reason: The reason to display when skipping.
-"""
-			)
+	def not_function(reason: str = default_reason.format("Not"), *, _condition: bool = condition) -> MarkDecorator:
+		return pytest.mark.skipif(condition=_condition, reason=reason)
 
-	if versionadded:
-		versionadded_string = f".. versionadded:: {versionadded}\n"
-	else:
-		versionadded_string = ''
+	def only_function(
+			reason: str = default_reason.format("Only"),
+			*,
+			_condition: bool = not condition,
+			) -> MarkDecorator:
+		return pytest.mark.skipif(condition=_condition, reason=reason)
 
 	not_function.__name__ = not_function.__qualname__ = f"not_{platform.lower()}"
 	not_function.__module__ = module
-	not_function.__doc__ = docstring.format(why="if", platform=platform, versionadded_string=versionadded_string)
 
 	only_function.__name__ = only_function.__qualname__ = f"only_{platform.lower()}"
 	only_function.__module__ = module
-	only_function.__doc__ = docstring.format(
-			why="unless", platform=platform, versionadded_string=versionadded_string
-			)
+
+	if sys.flags.optimize < 2:
+		# The docstrings are only consulted by Sphinx and help();
+		# under -OO they would be discarded anyway.
+		if platform_phrase is None:
+			platform_phrase = f"the current platform is {platform}"
+
+		if versionadded:
+			versionadded_string = f".. versionadded:: {versionadded}\n"
+		else:
+			versionadded_string = ''
+
+		not_function.__doc__ = _PLATFORM_DOCSTRING_TEMPLATE.format(
+				why="if", platform_phrase=platform_phrase, versionadded_string=versionadded_string
+				)
+		only_function.__doc__ = _PLATFORM_DOCSTRING_TEMPLATE.format(
+				why="unless", platform_phrase=platform_phrase, versionadded_string=versionadded_string
+				)
 
 	return not_function, only_function
 
 
-not_windows, only_windows = platform_boolean_factory(condition=sys.platform == "win32", platform="Windows")
-only_windows.__doc__ = f"""\
-{inspect.cleandoc(only_windows.__doc__ or '')}
+not_windows, only_windows = platform_boolean_factory(condition=_IS_WINDOWS, platform="Windows")
+
+if sys.flags.optimize < 2:
+	only_windows.__doc__ = f"""\
+{cast(str, only_windows.__doc__).rstrip()}
 
 :rtype:
 
 .. latex:clearpage::
 """
 
-not_macos, only_macos = platform_boolean_factory(condition=sys.platform == "darwin", platform="macOS")
+not_macos, only_macos = platform_boolean_factory(condition=_IS_MACOS, platform="macOS")
 
 not_linux, only_linux = platform_boolean_factory(
-		condition=sys.platform == "linux",
+		condition=_IS_LINUX,
 		platform="Linux",
 		versionadded="0.2.0"
 		)
-not_linux.__doc__ = f"""\
-{inspect.cleandoc(not_linux.__doc__ or '')}
+if sys.flags.optimize < 2:
+	not_linux.__doc__ = f"""\
+{cast(str, not_linux.__doc__).rstrip()}
 
 :rtype:
 
 .. latex:clearpage::
 """
 
-not_docker, only_docker = platform_boolean_factory(condition=is_docker(), platform="Docker")
-not_docker.__doc__ = cast(str, not_docker.__doc__).replace("the current platform is", "running on")
-only_docker.__doc__ = cast(str, only_docker.__doc__).replace("the current platform is", "running on")
+not_docker, only_docker = platform_boolean_factory(
+		condition=is_docker(),
+		platform="Docker",
+		platform_phrase="running on Docker",
+		)
 
-not_pypy, only_pypy = platform_boolean_factory(condition=PYPY, platform="PyPy")
-not_pypy.__doc__ = cast(str, not_pypy.__doc__).replace("current platform", "current Python implementation")
-only_pypy.__doc__ = cast(str, only_pypy.__doc__).replace("current platform", "current Python implementation")
+not_pypy, only_pypy = platform_boolean_factory(
+		condition=PYPY,
+		platform="PyPy",
+		platform_phrase="the current Python implementation is PyPy",
+		)
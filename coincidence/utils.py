@@ -36,14 +36,12 @@ import os
 import random
 from contextlib import contextmanager
 from functools import lru_cache
-from itertools import chain, permutations
-from typing import Any, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
+from itertools import permutations
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
 
 # 3rd party
 import pytest
 from domdf_python_tools.compat import PYPY
-from domdf_python_tools.iterative import Len
-from domdf_python_tools.paths import PathPlus
 
 __all__ = (
 		"generate_truthy_values",
@@ -56,39 +54,44 @@ __all__ = (
 
 _T = TypeVar("_T")
 
-_cgroup = PathPlus("/proc/self/cgroup")
+_cgroup = "/proc/self/cgroup"
 _dockerenv = "/.dockerenv"
 
 
+@lru_cache(maxsize=1)
 def is_docker() -> bool:
 	"""
 	Returns whether the current Python instance is running in Docker.
+
+	The result is cached for the lifetime of the process,
+	as it cannot change while the process is running.
 	"""
 
 	if os.path.exists(_dockerenv):
 		return True
 
-	if _cgroup.is_file():
+	if os.path.isfile(_cgroup):
 		try:
-			return any("docker" in line for line in _cgroup.read_lines())
-		except FileNotFoundError:
+			# Stream the file; any() short-circuits on the first match.
+			with open(_cgroup) as f:
+				return any("docker" in line for line in f)
+		except OSError:
 			return False
 
 	return False
 
 
 class _DateMeta(type):  # pragma: no cover (PyPy)
-	_date = datetime.date
 
-	def __instancecheck__(self, instance: Any):  # noqa: MAN002
-		return isinstance(instance, self._date)
+	def __instancecheck__(self, instance: Any, _date: type = datetime.date):  # noqa: MAN002
+		# The real class is bound as a default so the check reads a local, not a class attribute.
+		return isinstance(instance, _date)
 
 
 class _DatetimeMeta(type):  # pragma: no cover (PyPy)
-	_datetime = datetime.datetime
 
-	def __instancecheck__(self, instance: Any) -> bool:
-		return isinstance(instance, self._datetime)
+	def __instancecheck__(self, instance: Any, _datetime: type = datetime.datetime) -> bool:
+		return isinstance(instance, _datetime)
 
 
 @contextmanager
@@ -112,27 +115,16 @@ def with_fixed_datetime(fixed_datetime: datetime.datetime) -> Iterator:
 		Using ``from datetime import datetime`` won't work.
 	"""
 
+	# Build the returned values once, rather than on every today()/now() call.
+	fixed_date_today = datetime.date(fixed_datetime.year, fixed_datetime.month, fixed_datetime.day)
+	fixed_today = datetime.datetime(fixed_datetime.year, fixed_datetime.month, fixed_datetime.day)
+	fixed_now = datetime.datetime.fromtimestamp(fixed_datetime.timestamp())
+
 	if PYPY:  # pragma: no cover (!PyPy)
 
 		with pytest.MonkeyPatch.context() as monkeypatch:
-			monkeypatch.setattr(
-					datetime.date,
-					"today",
-					lambda *args: datetime.date(
-							fixed_datetime.year,
-							fixed_datetime.month,
-							fixed_datetime.day,
-							)
-					)
-			monkeypatch.setattr(
-					datetime.datetime,
-					"today",
-					lambda *args: datetime.datetime(
-							fixed_datetime.year,
-							fixed_datetime.month,
-							fixed_datetime.day,
-							)
-					)
+			monkeypatch.setattr(datetime.date, "today", lambda *args: fixed_date_today)
+			monkeypatch.setattr(datetime.datetime, "today", lambda *args: fixed_today)
 			monkeypatch.setattr(datetime.datetime, "now", lambda *args: fixed_datetime)
 
 			yield
@@ -143,25 +135,17 @@ def with_fixed_datetime(fixed_datetime: datetime.datetime) -> Iterator:
 
 			@classmethod
 			def today(cls) -> datetime.date:  # type: ignore[override]
-				return datetime.date(
-						fixed_datetime.year,
-						fixed_datetime.month,
-						fixed_datetime.day,
-						)
+				return fixed_date_today
 
 		class DT(datetime.datetime, metaclass=_DatetimeMeta):
 
 			@classmethod
 			def today(cls) -> datetime.datetime:  # type: ignore[override]
-				return datetime.datetime(
-						fixed_datetime.year,
-						fixed_datetime.month,
-						fixed_datetime.day,
-						)
+				return fixed_today
 
 			@classmethod
 			def now(cls, tz: Optional[datetime.tzinfo] = None) -> datetime.datetime:  # type: ignore[override]
-				return datetime.datetime.fromtimestamp(fixed_datetime.timestamp())
+				return fixed_now
 
 		D.__name__ = "date"
 		D.__qualname__ = "date"
@@ -170,11 +154,55 @@ def with_fixed_datetime(fixed_datetime: datetime.datetime) -> Iterator:
 		D.__module__ = "datetime"
 		DT.__module__ = "datetime"
 
-		with pytest.MonkeyPatch.context() as monkeypatch:
-			monkeypatch.setattr(datetime, "date", D)
-			monkeypatch.setattr(datetime, "datetime", DT)
+		# Allows fixtures to detect (and avoid re-applying) an active patch.
+		DT._coincidence_fixed = fixed_datetime  # type: ignore[attr-defined]
+
+		# Only two attributes to patch, so save and restore them directly
+		# rather than going through pytest.MonkeyPatch.
+		orig_date, orig_datetime = datetime.date, datetime.datetime
+		datetime.date = D  # type: ignore[misc]
+		datetime.datetime = DT  # type: ignore[misc]
 
+		try:
 			yield
+		finally:
+			datetime.date = orig_date  # type: ignore[misc]
+			datetime.datetime = orig_datetime  # type: ignore[misc]
+
+
+_TRUTHY_BASE: Tuple[Union[str, int], ...] = (
+		True,
+		"True",
+		"true",
+		"tRUe",
+		'y',
+		'Y',
+		"YES",
+		"yes",
+		"Yes",
+		"yEs",
+		"ON",
+		"on",
+		'1',
+		1,
+		)
+
+_FALSY_BASE: Tuple[Union[str, int], ...] = (
+		False,
+		"False",
+		"false",
+		"falSE",
+		'n',
+		'N',
+		"NO",
+		"no",
+		"nO",
+		"OFF",
+		"off",
+		"oFF",
+		'0',
+		0,
+		)
 
 
 def generate_truthy_values(
@@ -190,28 +218,19 @@ def generate_truthy_values(
 	:param ratio: The ratio of the number of values to select to the total number of values.
 	"""
 
-	truthy_values: Sequence[Union[str, int, _T]] = [
-			True,
-			"True",
-			"true",
-			"tRUe",
-			'y',
-			'Y',
-			"YES",
-			"yes",
-			"Yes",
-			"yEs",
-			"ON",
-			"on",
-			'1',
-			1,
-			*extra_truthy,
-			]
+	if not extra_truthy and ratio >= 1:
+		yield from _TRUTHY_BASE
+		return
 
-	if ratio < 1:
-		truthy_values = random.sample(truthy_values, int(len(truthy_values) * ratio))
+	truthy_values: Sequence[Union[str, int, _T]] = (*_TRUTHY_BASE, *extra_truthy)
 
-	yield from truthy_values
+	if ratio < 1:
+		# Sampling indices picks the same elements as sampling the sequence itself,
+		# but lets us yield lazily rather than materialising the sampled list first.
+		for idx in random.sample(range(len(truthy_values)), int(len(truthy_values) * ratio)):
+			yield truthy_values[idx]
+	else:
+		yield from truthy_values
 
 
 def generate_falsy_values(
@@ -227,34 +246,27 @@ def generate_falsy_values(
 	:param ratio: The ratio of the number of values to select to the total number of values.
 	"""
 
-	falsy_values: Sequence[Union[str, int, _T]] = [
-			False,
-			"False",
-			"false",
-			"falSE",
-			'n',
-			'N',
-			"NO",
-			"no",
-			"nO",
-			"OFF",
-			"off",
-			"oFF",
-			'0',
-			0,
-			*extra_falsy,
-			]
+	if not extra_falsy and ratio >= 1:
+		yield from _FALSY_BASE
+		return
 
-	if ratio < 1:
-		falsy_values = random.sample(falsy_values, int(len(falsy_values) * ratio))
+	falsy_values: Sequence[Union[str, int, _T]] = (*_FALSY_BASE, *extra_falsy)
 
-	yield from falsy_values
+	if ratio < 1:
+		for idx in random.sample(range(len(falsy_values)), int(len(falsy_values) * ratio)):
+			yield falsy_values[idx]
+	else:
+		yield from falsy_values
 
 
 whitespace = " \t\n\r"
 
+#: Every permutation of :data:`~.whitespace`, computed once at import.
+_WHITESPACE_PERMS: Tuple[str, ...] = tuple(
+		''.join(p) for n in range(len(whitespace)) for p in permutations(whitespace, n)
+		)
+
 
-@lru_cache(1)
 def whitespace_perms_list() -> List[str]:  # noqa: D103
-	perms = chain.from_iterable(permutations(whitespace, n) for n in Len(whitespace))
-	return list(''.join(x) for x in perms)
+	# A list copy is still far cheaper than regenerating the permutations.
+	return list(_WHITESPACE_PERMS)
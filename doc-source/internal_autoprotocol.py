@@ -8,6 +8,8 @@ from sphinx.util.inspect import safe_getattr
 from sphinx_toolbox.more_autodoc.autoprotocol import ProtocolDocumenter
 from sphinx_toolbox.utils import SphinxExtMetadata, allow_subclass_add, filter_members_warning
 
+_SPECIAL_SKIP = frozenset({"_abc_impl", "_is_runtime_protocol"})
+
 
 class CoincidenceProtocolDocumenter(ProtocolDocumenter):
 
@@ -25,28 +27,32 @@ class CoincidenceProtocolDocumenter(ProtocolDocumenter):
 
 		ret = []
 
+		base = self.object.__base__
+		base_dir = set(dir(base)) if base is not None else set()
+
 		# process members and determine which to skip
 		for (membername, member) in members:
 			# if isattr is True, the member is documented as an attribute
 
 			if safe_getattr(member, "__sphinx_mock__", False):
-				# mocked module or object
-				keep = False  # pragma: no cover
+				# mocked module or object; not up for debate,
+				# so don't consult autodoc-skip-member.
+				continue  # pragma: no cover
 
-			elif (
+			if (
 					self.options.get("exclude-protocol-members", [])
 					and membername in self.options["exclude-protocol-members"]
 					):
-				# remove members given by exclude-protocol-members
-				keep = False  # pragma: no cover
+				# explicitly removed by exclude-protocol-members
+				continue  # pragma: no cover
 
-			elif membername in {"_abc_impl", "_is_runtime_protocol"}:
+			if membername in _SPECIAL_SKIP:
 				keep = False
 
 			elif membername not in self.globally_excluded_methods:
 				# Magic method you wouldn't overload, or private method.
-				if membername in dir(self.object.__base__):
-					keep = member is not getattr(self.object.__base__, membername)
+				if membername in base_dir:
+					keep = member is not getattr(base, membername)
 				else:
 					keep = True
 
@@ -1,10 +1,11 @@
 # stdlib
+import os
+import tempfile
 from typing import List, Optional, Tuple
 
 # 3rd party
 from docutils import nodes, utils
 from docutils.nodes import Node, system_message
-from domdf_python_tools.paths import PathPlus
 from sphinx.application import Sphinx
 from sphinx.util.docutils import SphinxRole
 from sphinx.writers.html import HTMLTranslator
@@ -49,10 +50,23 @@ def replace_geq(app: Sphinx, exception: Optional[Exception] = None):
 	if app.builder.name.lower() != "latex":
 		return
 
-	output_file = PathPlus(app.builder.outdir) / f"{app.builder.titles[0][1]}.tex"
-	output_content = output_file.read_text()
-	output_content = output_content.replace('≥', r" $\geq$ ")
-	output_file.write_clean(output_content)
+	output_file = os.path.join(app.builder.outdir, f"{app.builder.titles[0][1]}.tex")
+
+	# Stream line-by-line into a temporary file and rename over the original,
+	# keeping peak memory bounded to a single line.
+	with open(output_file, encoding="UTF-8") as fin:
+		with tempfile.NamedTemporaryFile(
+				'w',
+				encoding="UTF-8",
+				dir=os.path.dirname(output_file),
+				delete=False,
+				) as fout:
+			for line in fin:
+				fout.write(line.replace('≥', r" $\geq$ "))
+
+			tmp_name = fout.name
+
+	os.replace(tmp_name, output_file)
 
 
 def setup(app: Sphinx):
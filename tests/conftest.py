@@ -1 +1,14 @@
+# stdlib
+import random
+
+# 3rd party
+import pytest
+
 pytest_plugins = ("coincidence", )
+
+
+@pytest.fixture(autouse=True)
+def _seed_rng() -> None:
+	# Several tests assert exact random.sample output; seeding every test
+	# keeps them deterministic without per-test boilerplate.
+	random.seed(1234)
@@ -32,5 +32,13 @@ def test_fixed_datetime():
 	assert datetime.datetime.now() - original_datetime(2019, 10, 13, 2, 20) == datetime.timedelta(days=366)
 
 
+@pytest.mark.usefixtures("fixed_datetime_session", "fixed_datetime")
+def test_fixed_datetime_session():
+	# fixed_datetime should detect the session-scoped patch and not re-apply it.
+	assert datetime.datetime.now() == datetime.datetime(2020, 10, 13, 2, 20)
+	assert datetime.datetime.today() == datetime.datetime(2020, 10, 13)
+	assert datetime.date.today() == datetime.date(2020, 10, 13)
+
+
 def test_path_separator(path_separator: str):
 	assert isinstance(path_separator, str)
@@ -1,5 +1,4 @@
 # stdlib
-import random
 import re
 from operator import itemgetter
 from typing import no_type_check
@@ -7,7 +6,6 @@ from typing import no_type_check
 # 3rd party
 import pytest
 from _pytest.mark import Mark, MarkDecorator, ParameterSet
-from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.utils import strtobool
 
 # this package
@@ -17,18 +15,20 @@ from coincidence.params import whitespace_perms
 
 
 def test_testing_boolean_strings():
-	assert isinstance(boolean_values_for_tests(), MarkDecorator)
-	assert isinstance(boolean_values_for_tests().mark, Mark)
-	assert "boolean_string, expected_boolean" in boolean_values_for_tests().mark.args
-	assert boolean_values_for_tests().mark.args[0] == "boolean_string, expected_boolean"
-	assert len(boolean_values_for_tests().mark.args[1]) == 28
-	assert isinstance(boolean_values_for_tests().mark.args[1], list)
-	assert isinstance(boolean_values_for_tests().mark.args[1][0], tuple)
-	assert len(boolean_values_for_tests().mark.args[1][0]) == 2
-	assert isinstance(boolean_values_for_tests().mark.args[1][0][0], bool)
-	assert isinstance(boolean_values_for_tests().mark.args[1][0][1], bool)
-
-	for value, expects in boolean_values_for_tests().mark.args[1]:
+	md = boolean_values_for_tests()
+
+	assert isinstance(md, MarkDecorator)
+	assert isinstance(md.mark, Mark)
+	assert "boolean_string, expected_boolean" in md.mark.args
+	assert md.mark.args[0] == "boolean_string, expected_boolean"
+	assert len(md.mark.args[1]) == 28
+	assert isinstance(md.mark.args[1], list)
+	assert isinstance(md.mark.args[1][0], tuple)
+	assert len(md.mark.args[1][0]) == 2
+	assert isinstance(md.mark.args[1][0][0], bool)
+	assert isinstance(md.mark.args[1][0][1], bool)
+
+	for value, expects in md.mark.args[1]:
 		assert strtobool(value) is expects
 
 
@@ -37,16 +37,14 @@ def test_count():
 	assert isinstance(count(100).mark, Mark)
 	assert "count" in count(100).mark.args
 	assert count(100).mark.args[0] == "count"
-	assert count(100).mark.args[1] == range(0, 100)
+	assert count(100).mark.args[1] == tuple(range(0, 100))
 
-	assert count(10).mark.args[1] == range(0, 10)
-	assert count(10, 5).mark.args[1] == range(5, 10)  # order of count is "stop, start, step"
-	assert count(10, 5, 2).mark.args[1] == range(5, 10, 2)  # order of count is "stop, start, step"
+	assert count(10).mark.args[1] == tuple(range(0, 10))
+	assert count(10, 5).mark.args[1] == tuple(range(5, 10))  # order of count is "stop, start, step"
+	assert count(10, 5, 2).mark.args[1] == tuple(range(5, 10, 2))  # order of count is "stop, start, step"
 
 
 def test_whitespace_perms():
-	random.seed(1234)
-
 	assert isinstance(whitespace_perms(), MarkDecorator)
 	assert isinstance(whitespace_perms().mark, Mark)
 	assert "char" in whitespace_perms().mark.args
@@ -70,17 +68,20 @@ def test_param():
 	assert param("3**2", 9, id="3^2").id == "3^2"
 	assert param("sqrt(9)", 3, key=itemgetter(0)).id == "sqrt(9)"
 
-	with pytest.raises(ValueError, match="'id', 'idx' and 'key' are mutually exclusive."):
-		param("sqrt(9)", 3, id="√9", key=itemgetter(0))  # type: ignore[call-overload]
-
-	with pytest.raises(ValueError, match="'id', 'idx' and 'key' are mutually exclusive."):
-		param("sqrt(9)", 3, id="√9", idx=0)  # type: ignore[call-overload]
+	bad_kwargs = [
+			{"id": "√9", "key": itemgetter(0)},
+			{"id": "√9", "idx": 0},
+			{"idx": 0, "key": itemgetter(0)},
+			{"id": "√9", "idx": 0, "key": itemgetter(0)},
+			]
 
-	with pytest.raises(ValueError, match="'id', 'idx' and 'key' are mutually exclusive."):
-		param("sqrt(9)", 3, idx=0, key=itemgetter(0))  # type: ignore[call-overload]
+	for kwargs in bad_kwargs:
+		with pytest.raises(ValueError, match="'id', 'idx' and 'key' are mutually exclusive."):
+			param("sqrt(9)", 3, **kwargs)  # type: ignore[call-overload]
 
-	with pytest.raises(ValueError, match="'id', 'idx' and 'key' are mutually exclusive."):
-		param("sqrt(9)", 3, id="√9", idx=0, key=itemgetter(0))  # type: ignore[call-overload]
+	# Deferred so collecting this module doesn't initialise domdf_python_tools.paths.
+	# 3rd party
+	from domdf_python_tools.paths import PathPlus
 
 	assert param(PathPlus("code.py"), key=lambda t: t[0].name).id == "code.py"
 
@@ -3,11 +3,11 @@ import pathlib
 import sys
 from collections import ChainMap, Counter, OrderedDict, defaultdict, namedtuple
 from types import MappingProxyType
-from typing import Any, Dict, Iterator, Mapping, NamedTuple, Sequence
+from typing import Any, Iterator, Mapping, NamedTuple, Sequence
 
 # 3rd party
 import pytest
-import toml
+from _pytest.capture import CaptureResult  # nodep
 from domdf_python_tools.compat import PYPY37_PLUS
 from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.stringlist import StringList
@@ -36,12 +36,16 @@ class DictSubclass(dict):
 	pass
 
 
-class TypingDictSubclass(Dict):
+class TypingDictSubclass(dict):
+	# Was a typing.Dict subclass; at runtime that's the same dict subclass,
+	# minus the generic-alias machinery on instantiation.
 	pass
 
 
 class CustomMapping(Mapping):
 
+	__slots__ = ("_dict", )
+
 	def __init__(self, *args, **kwargs):
 		self._dict = dict(*args, **kwargs)
 
@@ -57,6 +61,8 @@ class CustomMapping(Mapping):
 
 class CustomSequence(Sequence):
 
+	__slots__ = ("_elements", )
+
 	def __init__(self, *args, **kwargs):
 		self._elements = tuple(*args, **kwargs)
 
@@ -73,47 +79,121 @@ class CustomSequence(Sequence):
 some_toml = "[section]\ntable = {a = 1, b = 2, c = 3}"
 
 
-@pytest.mark.parametrize(
-		"data",
-		[
-				pytest.param({'a': 1, 'b': 2, 'c': 3}, id="dict"),
-				pytest.param(DictSubclass(a=1, b=2, c=3), id="DictSubclass"),
-				pytest.param(TypingDictSubclass(a=1, b=2, c=3), id="TypingDictSubclass"),
-				pytest.param(CustomMapping(a=1, b=2, c=3), id="CustomMapping"),
-				pytest.param(CustomSequence([1, 2, 3]), id="CustomSequence"),
-				pytest.param(OrderedDict(a=1, b=2, c=3), id="OrderedDict"),
-				pytest.param(Counter(a=1, b=2, c=3), id="Counter"),
-				pytest.param(defaultdict(int, a=1, b=2, c=3), id="defaultdict"),
-				pytest.param(Count(a=1, b=2, c=3), id="typing.NamedTuple"),
-				pytest.param(Count2(a=1, b=2, c=3), id="collections.namedtuple"),
-				pytest.param(['a', 1, 'b', 2, 'c', 3], id="list"),
-				pytest.param(('a', 1, 'b', 2, 'c', 3), id="tuple"),
-				pytest.param(MappingProxyType({'a': 1, 'b': 2, 'c': 3}), id="MappingProxyType"),
-				pytest.param(ChainMap({'a': 1}, {'b': 2}, {'c': 3}), id="ChainMap"),
-				pytest.param(
-						OrderedDict({'a': MappingProxyType({'a': 1})}), id="Nested_OrderedDict_MappingProxyType"
-						),
-				pytest.param(
-						OrderedDict({'a': CustomSequence([1, 2, 3])}), id="Nested_OrderedDict_CustomSequence"
-						),
-				pytest.param(
-						CustomSequence([MappingProxyType({'a': 1})]), id="Nested_CustomSequence_MappingProxyType"
-						),
-				pytest.param(CustomMapping({'a': Count(a=1, b=2, c=3)}), id="Nested_CustomMapping_NamedTuple"),
-				pytest.param(toml.loads(some_toml)["section"]["table"], id="Toml_InlineTableDict"),
-				pytest.param(pathlib.PurePath("/foo/bar/baz"), id="pathlib_purepath"),
-				pytest.param(pathlib.PurePosixPath("/foo/bar/baz"), id="pathlib_pureposixpath"),
-				pytest.param(pathlib.PureWindowsPath(r"c:\foo\bar\baz"), id="pathlib_purewindowspath"),
-				pytest.param(pathlib.Path("/foo/bar/baz"), id="pathlib_path"),
-				pytest.param(PathPlus("/foo/bar/baz"), id="pathplus"),
-				]
-		)
+def _toml_table():  # noqa: MAN002
+	# Deferred so runs which deselect this case never import or invoke the parser.
+	# 3rd party
+	import toml
+	return toml.loads(some_toml)["section"]["table"]
+
+
+_data_builders = {
+		"dict": lambda: {'a': 1, 'b': 2, 'c': 3},
+		"DictSubclass": lambda: DictSubclass(a=1, b=2, c=3),
+		"TypingDictSubclass": lambda: TypingDictSubclass(a=1, b=2, c=3),
+		"CustomMapping": lambda: CustomMapping(a=1, b=2, c=3),
+		"CustomSequence": lambda: CustomSequence([1, 2, 3]),
+		"OrderedDict": lambda: OrderedDict(a=1, b=2, c=3),
+		"Counter": lambda: Counter(a=1, b=2, c=3),
+		"defaultdict": lambda: defaultdict(int, a=1, b=2, c=3),
+		"typing.NamedTuple": lambda: Count(a=1, b=2, c=3),
+		"collections.namedtuple": lambda: Count2(a=1, b=2, c=3),
+		"list": lambda: ['a', 1, 'b', 2, 'c', 3],
+		"tuple": lambda: ('a', 1, 'b', 2, 'c', 3),
+		"MappingProxyType": lambda: MappingProxyType({'a': 1, 'b': 2, 'c': 3}),
+		"ChainMap": lambda: ChainMap({'a': 1}, {'b': 2}, {'c': 3}),
+		"Nested_OrderedDict_MappingProxyType": lambda: OrderedDict({'a': MappingProxyType({'a': 1})}),
+		"Nested_OrderedDict_CustomSequence": lambda: OrderedDict({'a': CustomSequence([1, 2, 3])}),
+		"Nested_CustomSequence_MappingProxyType": lambda: CustomSequence([MappingProxyType({'a': 1})]),
+		"Nested_CustomMapping_NamedTuple": lambda: CustomMapping({'a': Count(a=1, b=2, c=3)}),
+		"Toml_InlineTableDict": _toml_table,
+		"pathlib_purepath": lambda: pathlib.PurePath("/foo/bar/baz"),
+		"pathlib_pureposixpath": lambda: pathlib.PurePosixPath("/foo/bar/baz"),
+		"pathlib_purewindowspath": lambda: pathlib.PureWindowsPath(r"c:\foo\bar\baz"),
+		"pathlib_path": lambda: pathlib.Path("/foo/bar/baz"),
+		"pathplus": lambda: PathPlus("/foo/bar/baz"),
+		}
+
+
+@pytest.fixture(scope="session", params=_data_builders)
+def data(request) -> Any:  # noqa: MAN001
+	# Build the object at setup time, and only for the selected tests,
+	# rather than for every case at collection.
+	return _data_builders[request.param]()
+
+
 def test_advanced_data_regression(advanced_data_regression: AdvancedDataRegressionFixture, data: Any):
 	print(type(data))
 	print(data)
 	advanced_data_regression.check(data)
 
 
+def test_advanced_data_regression_binary(advanced_data_regression: AdvancedDataRegressionFixture):
+	advanced_data_regression.check({
+			"bytes": b"Hello World",
+			"bytearray": bytearray(b"\x00\x01\x02"),
+			})
+
+
+class CustomRepresented:
+	"""
+	A type which is only representable via a custom YAML representer.
+	"""
+
+	def __init__(self, value: int):
+		self.value = value
+
+
+def test_advanced_data_regression_custom_representer(
+		advanced_data_regression: AdvancedDataRegressionFixture,
+		):
+	# Representers registered through pytest_regressions' documented API
+	# must reach the dumper the advanced fixture actually uses.
+	# 3rd party
+	from pytest_regressions.data_regression import RegressionYamlDumper
+
+	RegressionYamlDumper.add_custom_yaml_representer(
+			CustomRepresented,
+			lambda dumper, data: dumper.represent_str(f"CustomRepresented({data.value})"),
+			)
+
+	advanced_data_regression.check({"obj": CustomRepresented(42)})
+
+
+def test_advanced_data_regression_fast_dumper_representer(
+		advanced_data_regression: AdvancedDataRegressionFixture,
+		):
+	# 3rd party
+	import yaml
+
+	dumper = type(advanced_data_regression)._yaml_dumper
+
+	# Deliberately not a CustomRepresented subclass, which may already have
+	# a (multi-)representer registered by the test above.
+	class FastCustomRepresented:
+
+		def __init__(self, value: int):
+			self.value = value
+
+	# Unknown types are rejected, just like the stock dumper...
+	with pytest.raises(yaml.representer.RepresenterError, match="cannot represent an object"):
+		advanced_data_regression.check({"obj": FastCustomRepresented(7)})
+
+	# ...until a representer is registered on the dumper itself.
+	dumper.add_custom_yaml_representer(
+			FastCustomRepresented,
+			lambda dumper, data: dumper.represent_str(f"FastCustomRepresented({data.value})"),
+			)
+
+	advanced_data_regression.check({"obj": FastCustomRepresented(7)})
+
+
+def test_lazy_data_regression_reexport():
+	# this package
+	from coincidence import regressions
+
+	assert regressions.DataRegressionFixture is AdvancedDataRegressionFixture.__bases__[0]
+
+
 def test_advanced_data_regression_capsys(advanced_data_regression: AdvancedFileRegressionFixture, capsys):
 	print("Hello World")
 	print("\t\tBoo!\t\t")
@@ -121,6 +201,11 @@ def test_advanced_data_regression_capsys(advanced_data_regression: AdvancedFileR
 	advanced_data_regression.check(capsys.readouterr())
 
 
+def test_advanced_data_regression_capsys_crlf(advanced_data_regression: AdvancedDataRegressionFixture):
+	# Carriage returns (e.g. from capsys on Windows) take the str.splitlines fallback.
+	advanced_data_regression.check(CaptureResult(out="Hello World\r\n\t\tBoo!\r\n", err="Bad\r\n"))
+
+
 def test_advanced_data_regression_capsys_nested(advanced_data_regression: AdvancedDataRegressionFixture, capsys):
 	print("Hello World")
 	print("\t\tBoo!\t\t")
@@ -134,22 +219,26 @@ else:
 	no_such_file_pattern = "No such file or directory: '.*'"
 
 
-def test_check_file_output(tmp_pathplus: PathPlus, file_regression: FileRegressionFixture):
+@pytest.fixture(scope="module")
+def prepopulated_dir(tmp_path_factory) -> PathPlus:  # noqa: MAN001
+	# The check_file_* tests only read these files, so write them once per module.
+	directory = PathPlus(tmp_path_factory.mktemp("file_regression"))
+	(directory / "file.txt").write_text("Success!")
+	(directory / "file.py").write_text("print('Success!')")
+	return directory
+
 
+def test_check_file_output_missing_file(tmp_pathplus: PathPlus, file_regression: FileRegressionFixture):
 	with pytest.raises(FileNotFoundError, match=no_such_file_pattern):
 		check_file_output(tmp_pathplus / "file.txt", file_regression)
 
-	(tmp_pathplus / "file.txt").write_text("Success!")
-	check_file_output(tmp_pathplus / "file.txt", file_regression)
 
-	(tmp_pathplus / "file.py").write_text("print('Success!')")
-	check_file_output(tmp_pathplus / "file.py", file_regression)
+def test_check_file_output(prepopulated_dir: PathPlus, file_regression: FileRegressionFixture):
+	check_file_output(prepopulated_dir / "file.txt", file_regression)
+	check_file_output(prepopulated_dir / "file.py", file_regression)
 
 
-def test_check_file_regression(tmp_pathplus: PathPlus, file_regression: FileRegressionFixture):
-	with pytest.raises(FileNotFoundError, match=no_such_file_pattern):
-		check_file_output(tmp_pathplus / "file.txt", file_regression)
-
+def test_check_file_regression(file_regression: FileRegressionFixture):
 	check_file_regression("Success!\n\nThis is a test.", file_regression)
 
 	result = StringList("Success!")
@@ -160,33 +249,36 @@ def test_check_file_regression(tmp_pathplus: PathPlus, file_regression: FileRegr
 	check_file_regression(result, file_regression)
 
 
-@pytest.mark.parametrize("contents", ["Hello\nWorld", "Hello World", StringList(["Hello", "World"])])
+@pytest.mark.parametrize(
+		"contents",
+		["Hello\nWorld", "Hello World", "Hello\nWorld\n\n\n", StringList(["Hello", "World"])],
+		ids=["newline", "space", "trailing_blanklines", "stringlist"],
+		)
 def test_advanced_file_regression(advanced_file_regression: AdvancedFileRegressionFixture, contents: str):
 	advanced_file_regression.check(contents)
 
 
-@pytest.mark.parametrize("contents", [b"hello world", ("hello world", ), [
-		"hello world",
-		], 12345])
+@pytest.mark.parametrize(
+		"contents",
+		[b"hello world", ("hello world", ), ["hello world"], 12345],
+		ids=["bytes", "tuple", "list", "int"],
+		)
 def test_advanced_file_regression_bad_type(advanced_file_regression: AdvancedFileRegressionFixture, contents: str):
 	with pytest.raises(TypeError, match="Expected text contents but received type '.*'"):
 		advanced_file_regression.check(contents)
 
 
-@not_windows("It's Windows")
-def test_advanced_file_regression_bytes(advanced_file_regression: AdvancedFileRegressionFixture):
-	advanced_file_regression.check_bytes(b"Hello World\n")
-
-
-def test_advanced_file_regression_output(
+def test_advanced_file_regression_missing_file(
 		tmp_pathplus: PathPlus,
 		advanced_file_regression: AdvancedFileRegressionFixture,
 		):
 	with pytest.raises(FileNotFoundError, match=no_such_file_pattern):
 		advanced_file_regression.check_file(tmp_pathplus / "file.txt")
 
-	(tmp_pathplus / "file.txt").write_text("Success!")
-	advanced_file_regression.check_file(tmp_pathplus / "file.txt")
 
-	(tmp_pathplus / "file.py").write_text("print('Success!')")
-	advanced_file_regression.check_file(tmp_pathplus / "file.py")
+def test_advanced_file_regression_output(
+		prepopulated_dir: PathPlus,
+		advanced_file_regression: AdvancedFileRegressionFixture,
+		):
+	advanced_file_regression.check_file(prepopulated_dir / "file.txt")
+	advanced_file_regression.check_file(prepopulated_dir / "file.py")
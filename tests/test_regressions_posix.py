@@ -0,0 +1,10 @@
+# this package
+from coincidence.regressions import AdvancedFileRegressionFixture
+from coincidence.selectors import not_windows
+
+# The whole module is POSIX-only, so evaluate the skip once at collection.
+pytestmark = not_windows("It's Windows")
+
+
+def test_advanced_file_regression_bytes(advanced_file_regression: AdvancedFileRegressionFixture):
+	advanced_file_regression.check_bytes(b"Hello World\n")
@@ -22,6 +22,11 @@ from coincidence.selectors import (
 		only_windows
 		)
 
+_IS_PYPY = platform.python_implementation() == "PyPy"
+_IS_WINDOWS = sys.platform == "win32"
+_IS_MACOS = sys.platform == "darwin"
+_IS_LINUX = sys.platform == "linux"
+
 
 @min_version((3, 4), reason="Failure")
 def test_min_version():
@@ -33,6 +38,12 @@ def test_max_version():
 	pass
 
 
+@min_version([3, 4], reason="Failure")  # type: ignore[arg-type]
+def test_min_version_list():
+	# Lists aren't documented as accepted, but have worked historically.
+	pass
+
+
 @pytest.mark.parametrize(
 		"py_version",
 		[
@@ -60,47 +71,47 @@ def test_parametrized_versions_mark(py_version: Tuple[int, int]):
 
 @not_pypy("Success")
 def test_not_pypy():
-	if platform.python_implementation() == "PyPy":
+	if _IS_PYPY:
 		assert False  # noqa: PT015
 
 
 @only_pypy("Success")
 def test_only_pypy():
-	if platform.python_implementation() != "PyPy":
+	if not _IS_PYPY:
 		assert False  # noqa: PT015
 
 
 @not_windows("Success")
 def test_not_windows():
-	if sys.platform == "win32":
+	if _IS_WINDOWS:
 		assert False  # noqa: PT015
 
 
 @only_windows("Success")
 def test_only_windows():
-	if sys.platform != "win32":
+	if not _IS_WINDOWS:
 		assert False  # noqa: PT015
 
 
 @not_macos("Success")
 def test_not_macos():
-	if sys.platform == "darwin":
+	if _IS_MACOS:
 		assert False  # noqa: PT015
 
 
 @only_macos("Success")
 def test_only_macos():
-	if sys.platform != "darwin":
+	if not _IS_MACOS:
 		assert False  # noqa: PT015
 
 
 @not_linux("Success")
 def test_not_linux():
-	if sys.platform == "linux":
+	if _IS_LINUX:
 		assert False  # noqa: PT015
 
 
 @only_linux("Success")
 def test_only_linux():
-	if sys.platform != "linux":
+	if not _IS_LINUX:
 		assert False  # noqa: PT015
@@ -1,6 +1,6 @@
 # stdlib
 import datetime
-import random
+from itertools import permutations
 
 # 3rd party
 import pytest
@@ -8,14 +8,18 @@ from domdf_python_tools.paths import PathPlus
 
 # this package
 import coincidence
-from coincidence.utils import generate_falsy_values, generate_truthy_values, with_fixed_datetime
+from coincidence.utils import (
+		generate_falsy_values,
+		generate_truthy_values,
+		whitespace,
+		whitespace_perms_list,
+		with_fixed_datetime
+		)
 
 original_datetime = datetime.datetime
 
 
 def test_generate_truthy_values():
-	random.seed(1234)
-
 	assert list(generate_truthy_values()) == [
 			True,
 			"True",
@@ -55,8 +59,6 @@ def test_generate_truthy_values():
 
 
 def test_generate_falsy_values():
-	random.seed(1234)
-
 	assert list(generate_falsy_values()) == [
 			False,
 			"False",
@@ -95,18 +97,36 @@ def test_generate_falsy_values():
 	assert list(generate_falsy_values(ratio=0.3)) == ['0', "no", "False", False]
 
 
-@pytest.mark.parametrize(
-		"fake_datetime, expected_date",
-		[
-				pytest.param(datetime.datetime(2020, 10, 13, 2, 20), datetime.datetime(2020, 10, 13), id='0'),
-				pytest.param(datetime.datetime(2020, 7, 4, 10, 00), datetime.datetime(2020, 7, 4), id='1'),
-				]
-		)
-def test_with_fixed_datetime(fake_datetime: datetime.datetime, expected_date: datetime.datetime):
+def test_whitespace_perms_list():
+	perms = whitespace_perms_list()
+
+	assert perms == [''.join(p) for n in range(len(whitespace)) for p in permutations(whitespace, n)]
+	assert len(perms) == 41
+
+	# Each call returns a fresh list, so callers may mutate the result.
+	assert whitespace_perms_list() is not perms
+
+
+def test_with_fixed_datetime():
+
+	cases = [
+			(datetime.datetime(2020, 10, 13, 2, 20), datetime.datetime(2020, 10, 13)),
+			(datetime.datetime(2020, 7, 4, 10, 00), datetime.datetime(2020, 7, 4)),
+			]
 
 	dt = datetime.datetime(2022, 4, 23, 16, 3, 6)
 	d = datetime.date(2022, 4, 23)
 
+	for fake_datetime, expected_date in cases:
+		_check_fixed_datetime(fake_datetime, expected_date, dt, d)
+
+
+def _check_fixed_datetime(
+		fake_datetime: datetime.datetime,
+		expected_date: datetime.datetime,
+		dt: datetime.datetime,
+		d: datetime.date,
+		):
 	with with_fixed_datetime(fake_datetime):
 		assert datetime.datetime.today() == expected_date
 		assert datetime.datetime.now() == fake_datetime
@@ -133,6 +153,8 @@ def test_with_fixed_datetime(fake_datetime: datetime.datetime, expected_date: da
 
 
 def test_is_docker(monkeypatch, tmp_pathplus: PathPlus):
+	is_docker = coincidence.utils.is_docker
+
 	cgroup = tmp_pathplus / "cgroup"
 	monkeypatch.setattr(coincidence.utils, "_cgroup", cgroup)
 	monkeypatch.setattr(coincidence.utils, "_dockerenv", (tmp_pathplus / "dockerenv").as_posix())
@@ -140,17 +162,29 @@ def test_is_docker(monkeypatch, tmp_pathplus: PathPlus):
 	assert not cgroup.exists()
 	assert not cgroup.is_file()
 
-	assert not coincidence.utils.is_docker()
+	# The result is cached for the process lifetime, so clear it between scenarios.
+	is_docker.cache_clear()
+	assert not is_docker()
 
 	(tmp_pathplus / "dockerenv").touch()
-	assert coincidence.utils.is_docker()
+	is_docker.cache_clear()
+	assert is_docker()
 
 	(tmp_pathplus / "dockerenv").unlink()
-	assert not coincidence.utils.is_docker()
+	is_docker.cache_clear()
+	assert not is_docker()
 
 	cgroup.write_text("HelloWorld\n\n\n\ndocker\n\n\nPython\n\n\n")
-	assert coincidence.utils.is_docker()
-
-	monkeypatch.setattr(PathPlus, "is_file", lambda *args: True)
-	cgroup.unlink()
-	assert not coincidence.utils.is_docker()
+	is_docker.cache_clear()
+	assert is_docker()
+
+	# Claim the cgroup file exists but don't create it,
+	# so the open() inside is_docker raises and exercises the OSError branch.
+	with monkeypatch.context() as m:
+		m.setattr("os.path.isfile", lambda path: True)
+		cgroup.unlink()
+		is_docker.cache_clear()
+		assert not is_docker()
+
+	# Don't leave a value cached against the monkeypatched paths.
+	is_docker.cache_clear()